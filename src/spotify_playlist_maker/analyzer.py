@@ -1,11 +1,19 @@
 import calendar
-from collections import defaultdict
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import date, datetime
 from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
 import spotipy
 
-from .constants import BATCH_SIZE
+from .cache import PlaylistCache
+from .constants import (
+    BATCH_SIZE,
+    MARKET_FROM_TOKEN,
+    MAX_WORKERS,
+    PLAYLIST_ITEM_FIELDS,
+)
 from .parser import extract_month_year_from_playlist
 from .results import AnalysisResults, Diff, Playlist, Song, YearMonth
 
@@ -18,12 +26,41 @@ class SpotifyAnalyzer:
     sp: spotipy.Spotify
     user: Dict[str, Any]
     playlist_format: str
+    playlist_cache: Optional[PlaylistCache]
 
     def __init__(
-        self, spotify_client: spotipy.Spotify, playlist_format: str = "[%Y] %B"
+        self,
+        spotify_client: spotipy.Spotify,
+        playlist_format: str = "[%Y] %B",
+        playlist_cache: Optional[PlaylistCache] = None,
     ):
         self.sp = spotify_client
         self.playlist_format = playlist_format
+        self.playlist_cache = playlist_cache
+
+        # The format is fixed, so check once whether strftime accepts it
+        try:
+            datetime(2000, 1, 1).strftime(playlist_format)
+            self._playlist_format_ok = True
+        except (ValueError, OSError):
+            self._playlist_format_ok = False
+        # Shared pool for individual API page requests; bounds how many
+        # requests are in flight at once to stay clear of rate limits
+        self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+        # Worker threads share this client, and spotipy reads (and may refresh
+        # and rewrite) the cached token on every request. Serialise token access
+        # so no thread reads a half-written cache or refreshes concurrently.
+        self._token_lock = threading.Lock()
+        auth_manager = getattr(self.sp, "auth_manager", None)
+        if auth_manager is not None:
+            get_access_token = auth_manager.get_access_token
+
+            def locked_get_access_token(*args: Any, **kwargs: Any) -> Any:
+                with self._token_lock:
+                    return get_access_token(*args, **kwargs)
+
+            auth_manager.get_access_token = locked_get_access_token
 
         user = self.sp.current_user()
         if user is None:
@@ -32,35 +69,70 @@ class SpotifyAnalyzer:
 
     def _create_song_from_track(self, track: Dict[str, Any]) -> Song:
         """Create Song object from Spotify track data."""
+        artists = track["artists"]
         return Song(
-            name=track["name"],
-            artist=", ".join([artist["name"] for artist in track["artists"]]),
-            uri=track["uri"],
+            # Interned since the same names and URIs appear on both sides of
+            # each comparison; equal strings then share one cached hash
+            name=sys.intern(track["name"]),
+            # Most tracks have a single artist, which needs no joining
+            artist=(
+                artists[0]["name"]
+                if len(artists) == 1
+                else ", ".join([artist["name"] for artist in artists])
+            ),
+            # Tracks fetched with a market may be relinked to a playable
+            # version; keep the original URI so both sides compare equal
+            uri=sys.intern((track.get("linked_from") or track)["uri"]),
         )
 
-    def _paginate_spotify_results(
+    def _refresh_token(self) -> None:
+        """Refresh the access token, if due, before fanning out requests.
+
+        Done once on the calling thread, so that worker threads find a fresh
+        token rather than each refreshing it when it nears expiry mid-run.
+        """
+        auth_manager = getattr(self.sp, "auth_manager", None)
+        if auth_manager is None:
+            return
+
+        # Mirrors spotipy, as not every auth manager accepts as_dict
+        try:
+            auth_manager.get_access_token(as_dict=False)
+        except TypeError:
+            auth_manager.get_access_token()
+
+    def _paginate_concurrently(
         self,
-        initial_results: Dict[str, Any],
+        fetch_page: Callable[[int], Dict[str, Any]],
         process_item_func: Callable[[Dict[str, Any]], Optional[T]],
     ) -> List[T]:
-        """Generic pagination handler for Spotify API results."""
-        items = []
-        results = initial_results
+        """Pagination handler that fetches all pages after the first in parallel.
 
-        while results:
-            for item in results["items"]:
+        The first page reports the total item count, so the remaining offsets
+        are known up front and can be requested concurrently. Every request,
+        including the first, goes through the shared pool so callers running
+        on other threads stay within its bound.
+        """
+        first_page = self._executor.submit(fetch_page, 0).result()
+        limit = first_page["limit"]
+        offsets = range(limit, first_page["total"], limit)
+        pages = [first_page, *self._executor.map(fetch_page, offsets)]
+
+        items = []
+        for page in pages:
+            for item in page["items"]:
                 processed = process_item_func(item)
                 if processed:
                     items.append(processed)
 
-            results = self.sp.next(results) if results["next"] else None  # type: ignore
-
         return items
 
     def analyze(
         self, target_dates: Optional[List[YearMonth]] = None
     ) -> AnalysisResults:
         """Perform complete analysis and return results."""
+        self._refresh_token()
+
         # Get user info
         username = self.user["display_name"] or self.user["id"]
 
@@ -102,15 +174,34 @@ class SpotifyAnalyzer:
         Returns:
             Dictionary mapping YearMonth objects to lists of songs
         """
-        liked_songs = defaultdict(list)
+        liked_songs: Dict[YearMonth, List[Song]] = {}
         total_songs = 0
 
-        # Determine oldest date for optimization
+        # Local aliases to avoid repeated attribute lookups in the loop below
+        create_song = self._create_song_from_track
+
+        # Liked songs come newest first, so consecutive songs nearly always share
+        # a month. Per-month state is only looked up when the month changes: the
+        # bound append for that month's list, or None if it isn't a target.
+        month_appenders: Dict[Tuple[int, int], Optional[Callable[[Song], None]]] = {}
+        current_year = current_month = 0
+        append: Optional[Callable[[Song], None]] = None
+
+        # Determine oldest date for optimization, as a key comparable with
+        # (year, month, day) tuples
         oldest_date = self._get_oldest_target_date(target_dates)
+        oldest_key = (
+            (oldest_date.year, oldest_date.month, oldest_date.day)
+            if oldest_date
+            else None
+        )
+        target_set = frozenset(target_dates) if target_dates else None
 
-        results = self.sp.current_user_saved_tracks(limit=BATCH_SIZE)
+        # Without a cut-off every page is needed, so fetch them all at once.
+        # With one, fetch growing windows of pages to limit wasted requests.
+        window = MAX_WORKERS if oldest_key else None
 
-        while results:
+        for results in self._iter_saved_track_pages(window):
             should_continue = False
             found_songs_in_batch = False
 
@@ -118,41 +209,104 @@ class SpotifyAnalyzer:
                 track = item["track"]
                 added_at = item["added_at"]
 
-                # Parse timestamp and check date constraints
-                added_date = datetime.fromisoformat(added_at.replace("Z", "+00:00"))
-                song_date = added_date.date()
-                year_month = YearMonth(added_date.year, added_date.month)
+                # Timestamps are always ISO 8601 in UTC ("YYYY-MM-DDTHH:MM:SSZ"),
+                # so the date parts can be sliced out without a full parse
+                year = int(added_at[0:4])
+                month = int(added_at[5:7])
+                song_date = (year, month, int(added_at[8:10]))
 
                 # Early termination optimization
-                if oldest_date and song_date < oldest_date:
+                if oldest_key and song_date < oldest_key:
                     break  # This will break out of the inner loop only
 
-                # Filter by target dates if specified
-                if target_dates and year_month not in target_dates:
-                    if oldest_date and song_date >= oldest_date:
+                if month != current_month or year != current_year:
+                    current_year, current_month = year, month
+                    if (year, month) in month_appenders:
+                        append = month_appenders[(year, month)]
+                    else:
+                        year_month = YearMonth(year, month)
+
+                        # Filter by target dates if specified
+                        if target_set and year_month not in target_set:
+                            append = None
+                        else:
+                            songs: List[Song] = []
+                            liked_songs[year_month] = songs
+                            append = songs.append
+                        month_appenders[(year, month)] = append
+
+                if append is None:
+                    if oldest_key:
                         should_continue = True
                     continue
 
-                # Extract song information
-                song = self._create_song_from_track(track)
-
-                liked_songs[year_month].append(song)
+                append(create_song(track))
                 total_songs += 1
                 found_songs_in_batch = True
 
                 should_continue = True
 
             # If we hit the oldest date cutoff and found no songs, stop completely
-            if oldest_date and not should_continue and not found_songs_in_batch:
+            if oldest_key and not should_continue and not found_songs_in_batch:
                 break
 
-            # Get next batch
-            if results["next"]:
-                results = self.sp.next(results)
-            else:
-                break
+        return liked_songs
+
+    def _fetch_saved_tracks_page(self, offset: int) -> Dict[str, Any]:
+        """Fetch a single page of the user's liked songs."""
+        # Passing a market drops the large available_markets lists
+        return self.sp.current_user_saved_tracks(  # type: ignore
+            limit=BATCH_SIZE, offset=offset, market=MARKET_FROM_TOKEN
+        )
+
+    def _iter_saved_track_pages(
+        self, window: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield pages of liked songs in order, fetching them concurrently.
 
-        return dict(liked_songs)
+        The first page reports the total, so the remaining pages are fetched by
+        offset. Without a ``window`` every page is requested before the first
+        one is yielded, so fetching overlaps with the caller processing pages.
+
+        With a ``window``, nothing more is requested until the caller asks for
+        the next page. Pages are then requested in windows that double from a
+        single page up to ``window`` pages. Stopping early wastes at most the
+        rest of the current window.
+        """
+        first_page = self._fetch_saved_tracks_page(0)
+
+        limit = first_page["limit"]
+        offsets = range(limit, first_page["total"], limit)
+
+        def submit(window_offsets: range) -> List[Future]:
+            return [
+                self._executor.submit(self._fetch_saved_tracks_page, offset)
+                for offset in window_offsets
+            ]
+
+        pending: List[Future] = []
+        try:
+            if window is None:
+                pending = submit(offsets)
+                yield first_page
+                for future in pending:
+                    yield future.result()
+                return
+
+            yield first_page
+
+            start, size = 0, 1
+            while start < len(offsets):
+                pending = submit(offsets[start : start + size])
+                for future in pending:
+                    yield future.result()
+                start += size
+                size = min(size * 2, window)
+        finally:
+            # Drop queued requests that are no longer needed if the caller
+            # stops early
+            for future in pending:
+                future.cancel()
 
     def _get_oldest_target_date(
         self, target_dates: Optional[List[YearMonth]]
@@ -169,16 +323,22 @@ class SpotifyAnalyzer:
         """Fetch all user-owned playlists."""
 
         def process_playlist(playlist: Dict[str, Any]) -> Optional[Playlist]:
+            # Checked before building a Playlist, so others are never constructed
             if playlist["owner"]["id"] == self.user["id"]:
                 return Playlist(
                     name=playlist["name"],
                     id=playlist["id"],
                     track_count=playlist["tracks"]["total"],
+                    snapshot_id=playlist["snapshot_id"],
                 )
             return None
 
-        results = self.sp.current_user_playlists(limit=BATCH_SIZE)
-        return self._paginate_spotify_results(results, process_playlist)
+        def fetch_page(offset: int) -> Dict[str, Any]:
+            return self.sp.current_user_playlists(  # type: ignore
+                limit=BATCH_SIZE, offset=offset
+            )
+
+        return self._paginate_concurrently(fetch_page, process_playlist)
 
     def get_playlist_tracks(self, playlist_id: str) -> List[Song]:
         """Fetch all tracks from a specific playlist."""
@@ -188,8 +348,28 @@ class SpotifyAnalyzer:
                 return self._create_song_from_track(item["track"])
             return None
 
-        results = self.sp.playlist_tracks(playlist_id, limit=BATCH_SIZE)
-        return self._paginate_spotify_results(results, process_track_item)
+        def fetch_page(offset: int) -> Dict[str, Any]:
+            return self.sp.playlist_items(  # type: ignore
+                playlist_id,
+                fields=PLAYLIST_ITEM_FIELDS,
+                limit=BATCH_SIZE,
+                offset=offset,
+                market=MARKET_FROM_TOKEN,
+            )
+
+        return self._paginate_concurrently(fetch_page, process_track_item)
+
+    def _get_cached_playlist_tracks(self, playlist: Playlist) -> List[Song]:
+        """Fetch tracks for a playlist, reusing cached tracks if it is unchanged."""
+        if self.playlist_cache is None:
+            return self.get_playlist_tracks(playlist.id)
+
+        songs = self.playlist_cache.get(playlist)
+        if songs is None:
+            songs = self.get_playlist_tracks(playlist.id)
+            self.playlist_cache.put(playlist, songs)
+
+        return songs
 
     def find_monthly_playlists(
         self, all_playlists: List[Playlist]
@@ -214,11 +394,32 @@ class SpotifyAnalyzer:
         """Compare liked songs vs playlists for all dates."""
         diffs = {}
 
+        # Fetch tracks for all matched playlists concurrently. This uses its own
+        # pool, since each fetch submits its page requests to the shared one;
+        # these threads only wait on those, so requests stay within MAX_WORKERS.
+        # Empty playlists are skipped, as there is nothing to fetch.
+        matched_dates = [
+            ym
+            for ym in songs_by_date
+            if ym in monthly_playlists and monthly_playlists[ym].track_count > 0
+        ]
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            fetched_tracks = pool.map(
+                lambda ym: self._get_cached_playlist_tracks(monthly_playlists[ym]),
+                matched_dates,
+            )
+            playlist_tracks = dict(zip(matched_dates, fetched_tracks))
+
+        if self.playlist_cache is not None:
+            # Forget playlists that have been deleted or renamed since
+            self.playlist_cache.prune(p.id for p in monthly_playlists.values())
+            self.playlist_cache.save()
+
         for year_month, liked_songs in songs_by_date.items():
             if year_month in monthly_playlists:
                 playlist = monthly_playlists[year_month]
 
-                playlist_songs = self.get_playlist_tracks(playlist.id)
+                playlist_songs = playlist_tracks.get(year_month, [])
                 diff = Diff(
                     date=year_month,
                     playlist=playlist,
@@ -238,32 +439,33 @@ class SpotifyAnalyzer:
 
         return diffs
 
-    def apply_diff_to_playlist(
-        self, playlist_id: str, missing_songs: List[Song]
-    ) -> None:
-        """Add missing songs to the playlist."""
-        if not missing_songs:
-            return
-
-        # Extract URIs for the songs to add
-        uris_to_add = [song.uri for song in missing_songs]
-
-        for i in range(0, len(uris_to_add), BATCH_SIZE):
-            batch = uris_to_add[i : i + BATCH_SIZE]
-            try:
-                self.sp.playlist_add_items(playlist_id, batch)
-            except Exception as e:
-                print(f"   ❌ Error adding batch: {e}")
+    def _add_batch_to_playlist(self, playlist_id: str, batch: List[str]) -> None:
+        """Add a single batch of track URIs to a playlist."""
+        try:
+            self.sp.playlist_add_items(playlist_id, batch)
+        except Exception as e:
+            print(f"   ❌ Error adding batch: {e}")
+
+    def _submit_songs_to_playlist(
+        self, playlist_id: str, songs: List[Song]
+    ) -> List[Future]:
+        """Start adding songs to the playlist in batches on the shared pool."""
+        uris = [song.uri for song in songs]
+        return [
+            self._executor.submit(
+                self._add_batch_to_playlist, playlist_id, uris[i : i + BATCH_SIZE]
+            )
+            for i in range(0, len(uris), BATCH_SIZE)
+        ]
 
     def create_playlist_for_date(self, date: YearMonth) -> str:
         """Create a new playlist for the given date and return its ID."""
-        # Create a datetime object for strftime formatting
-        try:
+        if self._playlist_format_ok:
             # Create datetime object with the 1st day of the month
             dt = datetime(date.year, date.month, 1)
             playlist_name = dt.strftime(self.playlist_format)
-        except (ValueError, OSError):
-            # Fallback to simple format if strftime fails
+        else:
+            # Fallback to simple format if strftime rejected the format
             playlist_name = str(date)
 
         # Create the playlist
@@ -288,14 +490,26 @@ class SpotifyAnalyzer:
         if total_songs_to_add == 0:
             return
 
-        for diff in diffs:
-            if not diff.liked_only_songs:
-                continue
+        self._refresh_token()
 
-            if diff.playlist is not None:
-                # Existing playlist - add missing songs
-                self.apply_diff_to_playlist(diff.playlist.id, diff.liked_only_songs)
-            else:
-                # No playlist exists - create one and add all liked songs
-                playlist_id = self.create_playlist_for_date(diff.date)
-                self.apply_diff_to_playlist(playlist_id, diff.liked_only_songs)
+        # Each diff's batches start as soon as its playlist exists, and all of
+        # them share one bounded pool
+        pending: List[Future] = []
+        try:
+            for diff in diffs:
+                if not diff.liked_only_songs:
+                    continue
+
+                if diff.playlist is not None:
+                    # Existing playlist - add missing songs
+                    playlist_id = diff.playlist.id
+                else:
+                    # No playlist exists - create one and add all liked songs
+                    playlist_id = self.create_playlist_for_date(diff.date)
+
+                pending.extend(
+                    self._submit_songs_to_playlist(playlist_id, diff.liked_only_songs)
+                )
+        finally:
+            # Let every started batch finish, even if creating a playlist failed
+            wait(pending)
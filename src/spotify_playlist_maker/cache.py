@@ -0,0 +1,92 @@
+"""
+On-disk cache of playlist tracks between runs.
+"""
+
+import json
+import os
+import sys
+from typing import Any, Dict, Iterable, List, Optional
+
+from .results import Playlist, Song
+
+
+def _is_valid_entry(entry: Any) -> bool:
+    """Check that a loaded cache entry has the shape written by put()."""
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("snapshot_id"), str)
+        and isinstance(entry.get("tracks"), list)
+        and all(
+            isinstance(track, list)
+            and len(track) == 3
+            and all(isinstance(field, str) for field in track)
+            for track in entry["tracks"]
+        )
+    )
+
+
+class PlaylistCache:
+    """Caches playlist tracks keyed by playlist snapshot.
+
+    Spotify gives every playlist a snapshot_id that changes whenever the
+    playlist is modified, so cached tracks are valid for as long as it matches.
+    """
+
+    path: str
+    entries: Dict[str, Dict[str, Any]]
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries = {}
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                loaded = json.load(f)
+        except (OSError, ValueError):
+            # Missing or unreadable cache - start from scratch
+            return
+
+        # Drop anything malformed, so a damaged file only costs a re-fetch
+        if isinstance(loaded, dict):
+            self.entries = {
+                playlist_id: entry
+                for playlist_id, entry in loaded.items()
+                if _is_valid_entry(entry)
+            }
+
+    def get(self, playlist: Playlist) -> Optional[List[Song]]:
+        """Return cached tracks for the playlist, or None if stale or missing."""
+        entry = self.entries.get(playlist.id)
+        if entry is None or entry["snapshot_id"] != playlist.snapshot_id:
+            return None
+
+        return [
+            Song(sys.intern(name), artist, sys.intern(uri))
+            for name, artist, uri in entry["tracks"]
+        ]
+
+    def put(self, playlist: Playlist, songs: List[Song]) -> None:
+        """Store the tracks for the playlist's current snapshot."""
+        self.entries[playlist.id] = {
+            "snapshot_id": playlist.snapshot_id,
+            "tracks": [[song.name, song.artist, song.uri] for song in songs],
+        }
+
+    def prune(self, playlist_ids: Iterable[str]) -> None:
+        """Drop entries for playlists other than the given ones."""
+        keep = set(playlist_ids)
+        self.entries = {
+            playlist_id: entry
+            for playlist_id, entry in self.entries.items()
+            if playlist_id in keep
+        }
+
+    def save(self) -> None:
+        """Write the cache to disk."""
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️  Could not save playlist cache: {e}")
@@ -3,4 +3,12 @@
 # Spotify API configuration
 SPOTIFY_SCOPES = "user-read-private user-library-read playlist-read-private playlist-modify-private playlist-modify-public"
 BATCH_SIZE = 50
+MAX_WORKERS = 10  # Maximum number of concurrent API requests
 CACHE_FILE = ".spotify_cache"
+PLAYLIST_CACHE_FILE = ".spotify_playlist_cache.json"
+
+# Request only the data we use, to keep responses small
+MARKET_FROM_TOKEN = "from_token"
+PLAYLIST_ITEM_FIELDS = (
+    "limit,total,items(track(name,uri,type,artists(name),linked_from(uri)))"
+)
@@ -17,7 +17,8 @@ import spotipy
 from spotipy.oauth2 import SpotifyOAuth
 
 from .analyzer import SpotifyAnalyzer
-from .constants import SPOTIFY_SCOPES, CACHE_FILE
+from .cache import PlaylistCache
+from .constants import SPOTIFY_SCOPES, CACHE_FILE, PLAYLIST_CACHE_FILE
 from .parser import parse_month_year
 from .results import YearMonth
 
@@ -110,14 +111,15 @@ def main() -> None:
 
     try:
         sp = create_spotify_client()
-        analyzer = SpotifyAnalyzer(sp, args.playlist_format)
+        playlist_cache = PlaylistCache(PLAYLIST_CACHE_FILE)
+        analyzer = SpotifyAnalyzer(sp, args.playlist_format, playlist_cache)
 
         # Perform analysis
         results = analyzer.analyze(target_dates)
 
-        # Print diffs only
-        for diff in results.diffs.values():
-            print(diff.format_diff())
+        # Print diffs only, in a single write
+        if results.diffs:
+            print("\n".join(diff.format_diff() for diff in results.diffs.values()))
 
         if all((diff.is_perfect_match for diff in results.diffs.values())):
             print("✅ All playlists are in sync with liked songs!")
@@ -91,6 +91,24 @@ def _build_month_names_dict() -> Dict[str, int]:
     return month_names
 
 
+# Computed once at import rather than for every playlist name
+_MONTH_NAMES = _build_month_names_dict()
+
+# Patterns for different playlist naming conventions
+_PATTERNS = [
+    r"\[(\d{4})\]\s*([a-zA-Z]+)",  # [2025] March, [2025] MON
+    r"([a-zA-Z]+)\s+(\d{4})",  # March 2025, MON 2025
+    r"(\d{4})[/\-]\s*([a-zA-Z]+)",  # 2025/March, 2025-MON
+    r"(\d{1,2})[/\-\s]+(\d{4})",  # 03 2025, 03-2025
+    r"(\d{4})[/\-](\d{1,2})",  # 2025-03, 2025/03
+]
+
+# Single alternation of all patterns, so a name is scanned in one pass
+_PLAYLIST_DATE_PATTERN = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in _PATTERNS), re.IGNORECASE
+)
+
+
 def extract_month_year_from_playlist(playlist_name: str) -> Optional[Tuple[int, int]]:
     """Extract (year, month) from playlist name using generous pattern matching.
 
@@ -100,27 +118,24 @@ def extract_month_year_from_playlist(playlist_name: str) -> Optional[Tuple[int,
     Returns:
         Tuple of (year, month) if found, None otherwise
     """
-    month_names = _build_month_names_dict()
-
-    # Patterns for different playlist naming conventions
-    patterns = [
-        r"\[(\d{4})\]\s*([a-zA-Z]+)",  # [2025] March, [2025] MON
-        r"([a-zA-Z]+)\s+(\d{4})",  # March 2025, MON 2025
-        r"(\d{4})[/\-]\s*([a-zA-Z]+)",  # 2025/March, 2025-MON
-        r"(\d{1,2})[/\-\s]+(\d{4})",  # 03 2025, 03-2025
-        r"(\d{4})[/\-](\d{1,2})",  # 2025-03, 2025/03
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, playlist_name, re.IGNORECASE)
-        if not match:
-            continue
-
-        group1, group2 = match.groups()
-        year, month = _parse_year_month_groups(group1, group2, month_names)
-
-        if year and month and 1 <= month <= 12:
-            return (year, month)
+    seen_groups = set()
+    match = _PLAYLIST_DATE_PATTERN.search(playlist_name)
+    while match:
+        # Every alternative has exactly two groups that must both match, so the
+        # last matched group identifies the pattern and the pair of groups
+        last_group: int = match.lastindex  # type: ignore # always set here
+
+        # As with searching each pattern separately, only a pattern's first
+        # match is considered
+        if last_group not in seen_groups:
+            seen_groups.add(last_group)
+            group1, group2 = match.group(last_group - 1, last_group)
+            year, month = _parse_year_month_groups(group1, group2, _MONTH_NAMES)
+
+            if year and month and 1 <= month <= 12:
+                return (year, month)
+
+        match = _PLAYLIST_DATE_PATTERN.search(playlist_name, match.start() + 1)
 
     return None
 
@@ -3,8 +3,13 @@ Data structures for passing analysis results.
 """
 
 from dataclasses import dataclass
+from functools import cached_property
+from operator import attrgetter
 from typing import Dict, List, Optional
 
+# Sort key for songs, implemented in C unlike an equivalent lambda
+_BY_NAME = attrgetter("name")
+
 
 @dataclass(frozen=True)
 class YearMonth:
@@ -26,6 +31,9 @@ class YearMonth:
 class Song:
     """Represents a song with its metadata."""
 
+    # Declared by hand since dataclass(slots=True) needs Python 3.10
+    __slots__ = ("name", "artist", "uri")
+
     name: str
     artist: str
     uri: str
@@ -35,56 +43,67 @@ class Song:
 class Playlist:
     """Represents a playlist with its metadata."""
 
+    __slots__ = ("name", "id", "track_count", "snapshot_id")
+
     name: str
     id: str
     track_count: int
+    snapshot_id: str
 
 
 @dataclass
 class Diff:
-    """Results of comparing liked songs vs playlist for a date."""
+    """Results of comparing liked songs vs playlist for a date.
+
+    Derived properties are computed on first access and cached, so the song
+    lists should not be modified after construction.
+    """
 
     date: YearMonth
     playlist: Optional[Playlist]
     liked_songs: List[Song]
     playlist_songs: List[Song]
 
-    @property
+    @cached_property
     def liked_uris(self) -> set:
         """URIs of liked songs."""
         return {song.uri for song in self.liked_songs}
 
-    @property
+    @cached_property
     def playlist_uris(self) -> set:
         """URIs of playlist songs."""
         return {song.uri for song in self.playlist_songs}
 
-    @property
+    @cached_property
     def liked_only_uris(self) -> set:
         """URIs only in liked songs."""
         return self.liked_uris - self.playlist_uris
 
-    @property
+    @cached_property
     def playlist_only_uris(self) -> set:
         """URIs only in playlist."""
         return self.playlist_uris - self.liked_uris
 
-    @property
+    @cached_property
     def liked_only_songs(self) -> List[Song]:
         """Songs liked but not in playlist."""
-        liked_dict = {song.uri: song for song in self.liked_songs}
-        return [liked_dict[uri] for uri in self.liked_only_uris]
+        liked_only = self.liked_only_uris
+        # Keyed by URI to drop duplicates while keeping the original order
+        songs = {s.uri: s for s in self.liked_songs if s.uri in liked_only}
+        return list(songs.values())
 
-    @property
+    @cached_property
     def playlist_only_songs(self) -> List[Song]:
         """Songs in playlist but not liked."""
-        playlist_dict = {song.uri: song for song in self.playlist_songs}
-        return [playlist_dict[uri] for uri in self.playlist_only_uris]
+        playlist_only = self.playlist_only_uris
+        songs = {s.uri: s for s in self.playlist_songs if s.uri in playlist_only}
+        return list(songs.values())
 
-    @property
+    @cached_property
     def is_perfect_match(self) -> bool:
         """True if liked songs and playlist are perfectly in sync."""
-        return len(self.liked_only_uris) == 0 and len(self.playlist_only_uris) == 0
+        # Set equality compares sizes before contents, so mismatches exit early
+        return self.liked_uris == self.playlist_uris
 
     def format_diff(self) -> str:
         """Generate a formatted diff display with emojis and styling."""
@@ -102,7 +121,7 @@ class Diff:
                 lines.append(
                     f"\n  ➕ Songs that would need a new playlist ({len(self.liked_songs)}):"
                 )
-                for song in sorted(self.liked_songs, key=lambda s: s.name):
+                for song in sorted(self.liked_songs, key=_BY_NAME):
                     lines.append(f"     • {song.name} - {song.artist}")
         else:
             # Summary stats
@@ -115,7 +134,7 @@ class Diff:
                 lines.append(
                     f"\n  ➕ Songs liked but NOT in playlist ({len(self.liked_only_songs)}):"
                 )
-                for song in sorted(self.liked_only_songs, key=lambda s: s.name):
+                for song in sorted(self.liked_only_songs, key=_BY_NAME):
                     lines.append(f"     • {song.name} - {song.artist}")
 
             # Songs in playlist but not liked
@@ -123,7 +142,7 @@ class Diff:
                 lines.append(
                     f"\n  ➖ Songs in playlist but NOT liked ({len(self.playlist_only_songs)}):"
                 )
-                for song in sorted(self.playlist_only_songs, key=lambda s: s.name):
+                for song in sorted(self.playlist_only_songs, key=_BY_NAME):
                     lines.append(f"     • {song.name} - {song.artist}")
 
             # Perfect match indicator